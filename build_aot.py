@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-time build of the numeric kernels in main.py
+Produces the stresskernels extension next to main.py, which then skips numba's JIT at startup
+
+Usage: python build_aot.py
+"""
+
+import os
+import sys
+
+from numba.pycc import CC
+
+# Make main.py take its JIT path while it is imported here, so an existing build does not shadow the sources
+sys.modules['stresskernels'] = None
+import main  # noqa: E402
+
+cc = CC('stresskernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+cc.export('moments', 'UniTuple(f8, 4)(f8[:])')(main._moments.py_func)
+cc.export('bucket_stats', 'UniTuple(f8[:], 3)(f8[:], f8[:], f8[:], f8[:], f8, f8, i8)')(main._bucket_stats.py_func)
+
+if __name__ == "__main__":
+    cc.compile()
@@ -6,119 +6,247 @@ Target: Configurable web application testing with detailed insights
 
 import asyncio
 import aiohttp
+import numpy as np
 import time
-import statistics
 import argparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 import requests
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+import io
 import json
+import multiprocessing
+from multiprocessing import shared_memory
+from multiprocessing.connection import wait as wait_connections
 import random
 import sys
 from datetime import datetime
 import threading
-
-
-@dataclass
+from collections import defaultdict, deque
+import heapq
+from bisect import bisect_right
+import errno
+import os
+import platform
+import re
+import socket
+import ssl
+from urllib.parse import urlsplit
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import stresskernels  # Ahead-of-time build of the kernels below, see build_aot.py
+except ImportError:
+    stresskernels = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# uvloop.run builds a libuv-backed loop for this run only, without touching the global policy.
+# It only exists in uvloop >= 0.18; older releases fall back to the default loop.
+run_event_loop = getattr(uvloop, 'run', None) or asyncio.run
+
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+}
+
+STATUS_MEANINGS = {
+    200: "OK", 201: "Created", 404: "Not Found",
+    500: "Server Error", 502: "Bad Gateway", 503: "Service Unavailable"
+}
+
+
+@dataclass(slots=True)
 class TestResult:
     """Store results of individual test requests"""
     status_code: int
-    response_time: float
+    rt_ns: int  # Response time in nanoseconds
     content_length: int
-    timestamp: float
+    ts_ns: int  # time.perf_counter_ns() when the request started
     thread_id: int = 0
     error: str = ""
-    ttfb: float = 0  # Time to first byte
+    ttfb_ns: int = 0  # Time to first byte in nanoseconds
+
+    @property
+    def response_time(self) -> float:
+        """Response time in seconds"""
+        return self.rt_ns / 1e9
 
 
-@dataclass
+@dataclass(slots=True)
 class TestReport:
     """Store comprehensive test results with performance insights"""
     total_requests: int = 0
     successful_requests: int = 0
     failed_requests: int = 0
-    response_times: List[float] = field(default_factory=list)
-    status_codes: Dict[int, int] = field(default_factory=dict)
+    status_codes: Dict[int, int] = field(default_factory=lambda: defaultdict(int))
     errors: List[str] = field(default_factory=list)
-    start_time: float = field(default_factory=time.time)
-    end_time: float = 0
+    start_ns: int = field(default_factory=time.perf_counter_ns)
+    end_ns: int = 0
     requests_per_second: float = 0
-    results: List[TestResult] = field(default_factory=list)
     peak_rps: float = 0
     slowest_requests: List[TestResult] = field(default_factory=list)
+    # Slowest results kept whole for drill-down, as a min-heap of (rt_ns, seq, result)
+    slowest_sample: List[Tuple[int, int, TestResult]] = field(default_factory=list, repr=False)
+
+    # Response times in seconds, converted from the nanosecond column by _finalize_report
+    rt_array: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64), repr=False)
+    # summarize(rt_array), computed once by _finalize_report and shared by the analysis and the printout
+    rt_summary: Dict[str, float] = field(default_factory=dict, repr=False)
+
+    # Response time column in nanoseconds, the only per-result field the analysis reads; the first _n rows are valid
+    _cap: int = field(default=1024, init=False, repr=False)
+    _n: int = field(default=0, init=False, repr=False)
+    _rt: np.ndarray = field(init=False, repr=False)
+    # Running [sum_rt_ns, count, ok_count] per whole second since start_ns
+    second_buckets: Dict[int, List[int]] = field(init=False, repr=False)
+
+    SLOWEST_SAMPLE_SIZE = 64
+
+    def __post_init__(self):
+        self._rt = np.empty(self._cap, dtype=np.int64)
+        self.second_buckets = defaultdict(lambda: [0, 0, 0])
+
+    @property
+    def rt_ns_array(self) -> np.ndarray:
+        return self._rt[:self._n]
+
+
+def _bucket_stats_numpy(seconds: np.ndarray, sum_rt: np.ndarray, count: np.ndarray, ok_count: np.ndarray,
+                        start: float, bucket_size: float, num_buckets: int):
+    """Merge per-second (sum_rt, count, ok_count) rows into num_buckets time windows (vectorized fallback)"""
+    idx = np.minimum(((seconds - start) / bucket_size).astype(np.int64), num_buckets - 1)
+    return (np.bincount(idx, weights=sum_rt, minlength=num_buckets),
+            np.bincount(idx, weights=count, minlength=num_buckets),
+            np.bincount(idx, weights=ok_count, minlength=num_buckets))
+
+
+if stresskernels is not None:
+    _bucket_stats = stresskernels.bucket_stats
+elif njit is not None:
+    @njit(cache=True, nogil=True)
+    def _bucket_stats(seconds, sum_rt, count, ok_count, start, bucket_size, num_buckets):
+        """Merge per-second (sum_rt, count, ok_count) rows into num_buckets time windows in one compiled loop"""
+        bucket_rt = np.zeros(num_buckets, dtype=np.float64)
+        bucket_count = np.zeros(num_buckets, dtype=np.float64)
+        bucket_ok = np.zeros(num_buckets, dtype=np.float64)
+
+        for i in range(seconds.shape[0]):
+            idx = min(int((seconds[i] - start) / bucket_size), num_buckets - 1)
+            bucket_rt[idx] += sum_rt[i]
+            bucket_count[idx] += count[i]
+            bucket_ok[idx] += ok_count[i]
+
+        return bucket_rt, bucket_count, bucket_ok
+else:
+    _bucket_stats = _bucket_stats_numpy
+
+
+def _moments_numpy(rt: np.ndarray):
+    """Return (mean, sum of squared deviations, min, max) of rt (vectorized fallback)"""
+    mean = rt.mean()
+    return mean, float(((rt - mean) ** 2).sum()), rt.min(), rt.max()
+
+
+if stresskernels is not None:
+    _moments = stresskernels.moments
+elif njit is not None:
+    @njit(cache=True, nogil=True)
+    def _moments(rt):
+        """Return (mean, sum of squared deviations, min, max) of rt in a single compiled pass"""
+        # Welford's update keeps the variance stable without a second pass over the mean
+        mean = 0.0
+        m2 = 0.0
+        mn = rt[0]
+        mx = rt[0]
+        for i in range(rt.shape[0]):
+            x = rt[i]
+            delta = x - mean
+            mean += delta / (i + 1)
+            m2 += delta * (x - mean)
+            if x < mn:
+                mn = x
+            if x > mx:
+                mx = x
+        return mean, m2, mn, mx
+else:
+    _moments = _moments_numpy
+
+
+def summarize(rt: np.ndarray) -> Dict[str, float]:
+    """Summarize a non-empty response time array: one pass for the moments, one partition for the ranks"""
+    n = rt.size
+    mean, m2, mn, mx = _moments(rt)
+
+    # Nearest-rank percentiles, as the original sorted-list indexing did; partition places just these ranks
+    lo, hi = (n - 1) // 2, n // 2
+    ranks = (int(n * 0.90), int(n * 0.95), int(n * 0.99))
+    part = np.partition(rt, sorted({lo, hi, *ranks}))
+
+    return {
+        'mean': float(mean),
+        'median': float(part[lo] + part[hi]) / 2,
+        'min': float(mn),
+        'max': float(mx),
+        'std': float(np.sqrt(m2 / (n - 1))) if n > 1 else 0.0,
+        'p90': float(part[ranks[0]]),
+        'p95': float(part[ranks[1]]),
+        'p99': float(part[ranks[2]]),
+    }
 
 
 class PerformanceAnalyzer:
     """Analyze performance data and provide insights"""
 
-    @staticmethod
-    def calculate_performance_grade(avg_response_time: float, success_rate: float, rps: float) -> str:
+    # Scoring tables; bisect_right(thresholds, x) counts the thresholds at or below x, which selects
+    # the score band. Response time uses strict "<" bounds, success rate and throughput use ">=".
+    _RT_THRESH = (0.2, 0.5, 1.0, 2.0)
+    _RT_SCORES = (40, 35, 25, 15, 5)  # Response time scoring (40% weight)
+    _SR_THRESH = (75, 90, 95, 99.5)
+    _SR_SCORES = (5, 15, 25, 35, 40)  # Success rate scoring (40% weight)
+    _RPS_THRESH = (5, 10, 20, 50)
+    _RPS_SCORES = (5, 10, 15, 18, 20)  # Throughput scoring (20% weight)
+    _GRADE_THRESH = (50, 60, 70, 80, 90)
+    _GRADES = ("F (Critical)", "D (Poor)", "C (Fair)", "B (Good)", "A (Very Good)", "A+ (Excellent)")
+
+    @classmethod
+    def calculate_performance_grade(cls, avg_response_time: float, success_rate: float, rps: float) -> str:
         """Calculate overall performance grade"""
-        score = 0
-
-        # Response time scoring (40% weight)
-        if avg_response_time < 0.2:
-            score += 40
-        elif avg_response_time < 0.5:
-            score += 35
-        elif avg_response_time < 1.0:
-            score += 25
-        elif avg_response_time < 2.0:
-            score += 15
-        else:
-            score += 5
-
-        # Success rate scoring (40% weight)
-        if success_rate >= 99.5:
-            score += 40
-        elif success_rate >= 95:
-            score += 35
-        elif success_rate >= 90:
-            score += 25
-        elif success_rate >= 75:
-            score += 15
-        else:
-            score += 5
-
-        # Throughput scoring (20% weight)
-        if rps >= 50:
-            score += 20
-        elif rps >= 20:
-            score += 18
-        elif rps >= 10:
-            score += 15
-        elif rps >= 5:
-            score += 10
-        else:
-            score += 5
-
-        if score >= 90:
-            return "A+ (Excellent)"
-        elif score >= 80:
-            return "A (Very Good)"
-        elif score >= 70:
-            return "B (Good)"
-        elif score >= 60:
-            return "C (Fair)"
-        elif score >= 50:
-            return "D (Poor)"
-        else:
-            return "F (Critical)"
+        score = (cls._RT_SCORES[bisect_right(cls._RT_THRESH, avg_response_time)] +
+                 cls._SR_SCORES[bisect_right(cls._SR_THRESH, success_rate)] +
+                 cls._RPS_SCORES[bisect_right(cls._RPS_THRESH, rps)])
+        return cls._GRADES[bisect_right(cls._GRADE_THRESH, score)]
 
     @staticmethod
-    def analyze_performance_trends(results: List[TestResult]) -> Dict[str, Any]:
+    def analyze_performance_trends(report: TestReport) -> Dict[str, Any]:
         """Analyze performance trends over time"""
-        if not results:
+        buckets = report.second_buckets
+        if not buckets:
             return {}
 
-        # Sort by timestamp
-        sorted_results = sorted(results, key=lambda x: x.timestamp)
+        # Per-second [sum_rt_ns, count, ok_count] rows were accumulated by _update_report
+        seconds = np.fromiter(buckets.keys(), dtype=np.float64, count=len(buckets))
+        rows = np.array(list(buckets.values()), dtype=np.float64)
 
         # Split into time windows
-        start_time = sorted_results[0].timestamp
-        end_time = sorted_results[-1].timestamp
-        duration = end_time - start_time
+        start_time = float(seconds.min())
+        duration = float(seconds.max()) - start_time
 
         if duration < 1:
             return {"trend": "insufficient_data"}
@@ -126,22 +254,17 @@ class PerformanceAnalyzer:
         # Create time buckets
         num_buckets = min(10, int(duration))
         bucket_size = duration / num_buckets
-        buckets = [[] for _ in range(num_buckets)]
-
-        for result in sorted_results:
-            bucket_idx = min(int((result.timestamp - start_time) / bucket_size), num_buckets - 1)
-            buckets[bucket_idx].append(result)
+        sum_rt, counts, ok_counts = _bucket_stats(seconds, rows[:, 0], rows[:, 1], rows[:, 2],
+                                                  start_time, bucket_size, num_buckets)
 
         # Calculate metrics per bucket
         bucket_metrics = []
-        for bucket in buckets:
-            if bucket:
-                avg_response_time = statistics.mean([r.response_time for r in bucket])
-                success_rate = sum(1 for r in bucket if r.status_code == 200) / len(bucket) * 100
+        for bucket_sum, count, ok_count in zip(sum_rt.tolist(), counts.tolist(), ok_counts.tolist()):
+            if count:
                 bucket_metrics.append({
-                    'avg_response_time': avg_response_time,
-                    'success_rate': success_rate,
-                    'count': len(bucket)
+                    'avg_response_time': bucket_sum / count / 1e9,
+                    'success_rate': ok_count / count * 100,
+                    'count': int(count)
                 })
 
         if len(bucket_metrics) < 2:
@@ -176,10 +299,10 @@ class PerformanceAnalyzer:
         """Identify potential performance bottlenecks"""
         bottlenecks = []
 
-        if not report.response_times:
+        if not report.rt_array.size:
             return ["No response data available"]
 
-        avg_response_time = statistics.mean(report.response_times)
+        avg_response_time = report.rt_summary['mean']
         success_rate = (report.successful_requests / report.total_requests) * 100
 
         # Response time analysis
@@ -199,8 +322,8 @@ class PerformanceAnalyzer:
             bottlenecks.append("LOW_THROUGHPUT: Server can't handle concurrent requests efficiently")
 
         # Variability analysis
-        if len(report.response_times) > 1:
-            std_dev = statistics.stdev(report.response_times)
+        if report.rt_array.size > 1:
+            std_dev = report.rt_summary['std']
             if std_dev > avg_response_time * 0.5:
                 bottlenecks.append("HIGH_VARIABILITY: Response times are inconsistent")
 
@@ -220,10 +343,10 @@ class PerformanceAnalyzer:
     @staticmethod
     def capacity_recommendations(report: TestReport, test_type: str) -> Dict[str, Any]:
         """Provide capacity and optimization recommendations"""
-        if not report.response_times:
+        if not report.rt_array.size:
             return {"error": "No data available"}
 
-        avg_response_time = statistics.mean(report.response_times)
+        avg_response_time = report.rt_summary['mean']
         success_rate = (report.successful_requests / report.total_requests) * 100
 
         recommendations = {
@@ -273,144 +396,906 @@ class PerformanceAnalyzer:
         return recommendations
 
 
+class ProgressPrinter:
+    """In-place progress line, redrawn at most every INTERVAL seconds however fast requests complete"""
+
+    INTERVAL = 0.25
+    # Set in --procs worker processes, which publish their count here for the parent to print
+    sink: Optional[np.ndarray] = None
+
+    def __init__(self, total: int):
+        self.total = total
+        self._next_print = time.monotonic()
+
+    def update(self, completed: int):
+        now = time.monotonic()
+        if now >= self._next_print:
+            if self.sink is not None:
+                self.sink[0] = completed
+            else:
+                sys.stdout.write(f"\r   Progress: {completed}/{self.total} requests completed")
+                sys.stdout.flush()
+            self._next_print = now + self.INTERVAL
+
+    def finish(self):
+        if self.sink is not None:
+            self.sink[0] = self.total
+            return
+        sys.stdout.write(f"\r   Progress: {self.total}/{self.total} requests completed\n")
+        sys.stdout.flush()
+
+
+class HTTPResponseParser:
+    """Incremental HTTP/1.1 response parser that only tracks status and body framing"""
+
+    _HEAD, _BODY, _CHUNK_SIZE, _CHUNK_DATA, _CHUNK_END, _TRAILER, _UNTIL_CLOSE, _DONE = range(8)
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.status_code = 0
+        self.body_length = 0
+        self.keep_alive = True
+        self._state = self._HEAD
+        self._remaining = 0
+        self._buffer = bytearray()
+
+    def feed(self, data) -> bool:
+        """Consume received bytes, return True once the full response has been read"""
+        if self._state == self._BODY and not self._buffer:
+            # Content-Length body: count the bytes straight out of the receive buffer without copying
+            take = min(len(data), self._remaining)
+            self.body_length += take
+            self._remaining -= take
+            if self._remaining:
+                return False
+            self._state = self._DONE
+            return True
+
+        buffer = self._buffer
+        buffer += data
+
+        while True:
+            state = self._state
+
+            if state == self._HEAD:
+                end = buffer.find(b"\r\n\r\n")
+                if end < 0:
+                    return False
+                self._parse_head(bytes(buffer[:end]))
+                del buffer[:end + 4]
+
+            elif state == self._BODY or state == self._CHUNK_DATA:
+                take = min(len(buffer), self._remaining)
+                self.body_length += take
+                self._remaining -= take
+                del buffer[:take]
+                if self._remaining:
+                    return False
+                self._state = self._DONE if state == self._BODY else self._CHUNK_END
+
+            elif state == self._CHUNK_SIZE or state == self._TRAILER:
+                end = buffer.find(b"\r\n")
+                if end < 0:
+                    return False
+                line = bytes(buffer[:end])
+                del buffer[:end + 2]
+                if state == self._TRAILER:
+                    if not line:
+                        self._state = self._DONE
+                    continue
+                self._remaining = int(line.split(b";", 1)[0], 16)
+                self._state = self._CHUNK_DATA if self._remaining else self._TRAILER
+
+            elif state == self._CHUNK_END:
+                if len(buffer) < 2:
+                    return False
+                del buffer[:2]
+                self._state = self._CHUNK_SIZE
+
+            elif state == self._UNTIL_CLOSE:
+                self.body_length += len(buffer)
+                buffer.clear()
+                return False
+
+            else:
+                return True
+
+    def feed_eof(self) -> bool:
+        """Signal that the peer closed the connection, return True if the response is complete"""
+        if self._state == self._UNTIL_CLOSE:
+            self._state = self._DONE
+        self.keep_alive = False
+        return self._state == self._DONE
+
+    def _parse_head(self, head: bytes):
+        lines = head.split(b"\r\n")
+        version, _, rest = lines[0].partition(b" ")
+        self.status_code = int(rest[:3])
+
+        headers = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(b":")
+            headers[name.strip().lower()] = value.strip().lower()
+
+        connection = headers.get(b"connection", b"")
+        self.keep_alive = connection != b"close" if version == b"HTTP/1.1" else connection == b"keep-alive"
+
+        if self.status_code < 200 or self.status_code in (204, 304):
+            self._state = self._DONE
+        elif headers.get(b"transfer-encoding", b"").endswith(b"chunked"):
+            self._state = self._CHUNK_SIZE
+        elif b"content-length" in headers:
+            self._remaining = int(headers[b"content-length"])
+            self._state = self._BODY if self._remaining else self._DONE
+        else:
+            self._state = self._UNTIL_CLOSE
+            self.keep_alive = False
+
+
+class _UringConnection:
+    """Per-socket state for UringTransport"""
+    __slots__ = ('sock', 'parser', 'recv_buffer', 'start_ns', 'first_byte_ns', 'error')
+
+    def __init__(self, recv_size: int):
+        self.sock = None
+        self.parser = HTTPResponseParser()
+        self.recv_buffer = bytearray(recv_size)
+        self.start_ns = 0
+        self.first_byte_ns = 0
+        self.error = ""
+
+
+class UringTransport:
+    """Batched HTTP/1.1 GET load generator on io_uring (Linux >= 5.6, plain http:// only)"""
+
+    SEND, RECV = 0, 1
+    RECV_SIZE = 64 * 1024
+    SPIN_TIME = 0.001  # How long to poll the CQ in SQPOLL mode before blocking in io_uring_enter
+    MAX_FIXED_BUFFERS = 1024  # Iovec is capped at IOV_MAX entries
+
+    def __init__(self, host: str, port: int, request_bytes: bytes, num_connections: int,
+                 timeout: float = 30, sqpoll: bool = False):
+        self.host = host
+        self.port = port
+        self.request_bytes = request_bytes
+        self.timeout = timeout
+        self.connections = [_UringConnection(self.RECV_SIZE) for _ in range(num_connections)]
+        self.ring = liburing.Ring()
+        self.cqe = liburing.Cqe()
+        self.sqpoll = False
+        self.fixed_buffers = None
+
+        # Each connection has at most a linked SEND+RECV pair queued at once
+        entries = 1 << max(1, (2 * num_connections - 1).bit_length())
+        try:
+            if sqpoll:
+                # A kernel thread polls the SQ, so submitting is just a ring write while it is awake.
+                # sq_thread_idle is left at the kernel default of one second.
+                liburing.io_uring_queue_init(entries, self.ring, liburing.IORING_SETUP_SQPOLL)
+                self.sqpoll = True
+            else:
+                # Only this thread ever touches the ring
+                liburing.io_uring_queue_init(entries, self.ring, liburing.IORING_SETUP_SINGLE_ISSUER |
+                                             liburing.IORING_SETUP_DEFER_TASKRUN)
+        except OSError:
+            if sqpoll:
+                print("   ⚠️  IORING_SETUP_SQPOLL rejected by the kernel, submitting with io_uring_enter")
+            liburing.io_uring_queue_init(entries, self.ring, 0)
+
+        liburing.io_uring_register_files(self.ring, liburing.FileIndex([-1] * num_connections))
+
+        # Register the request bytes (index 0) and each connection's recv buffer (index i + 1)
+        # once, so sends and receives skip pinning user pages on every operation
+        if num_connections < self.MAX_FIXED_BUFFERS:
+            buffers = liburing.Iovec([request_bytes] + [conn.recv_buffer for conn in self.connections])
+            try:
+                liburing.io_uring_register_buffers(self.ring, buffers)
+                self.fixed_buffers = buffers
+            except OSError:
+                pass
+
+    @staticmethod
+    def supported(url: str) -> bool:
+        """io_uring needs liburing, Linux >= 5.6 (IORING_OP_SEND/RECV) and an unencrypted target"""
+        parts = urlsplit(url)
+        if liburing is None or platform.system() != "Linux" or parts.scheme != "http" or not parts.hostname:
+            return False
+        try:
+            parts.port
+        except ValueError:
+            return False
+        match = re.match(r"(\d+)\.(\d+)", platform.release())
+        return bool(match) and (int(match.group(1)), int(match.group(2))) >= (5, 6)
+
+    def close(self):
+        for conn in self.connections:
+            if conn.sock is not None:
+                conn.sock.close()
+                conn.sock = None
+        liburing.io_uring_queue_exit(self.ring)
+        self.fixed_buffers = None
+
+    def run(self, num_requests: int) -> List[TestResult]:
+        """Issue num_requests GETs spread over the connections and return their results"""
+        results = []
+        issued = 0
+        thread_id = threading.get_ident()
+        wait_timeout = liburing.timespec(self.timeout)
+        progress = ProgressPrinter(num_requests)
+
+        in_flight = set()
+
+        def record(index: int, now: int, error: str = ""):
+            conn = self.connections[index]
+            parser = conn.parser
+            in_flight.discard(index)
+            progress.update(len(results))
+            results.append(TestResult(
+                status_code=0 if error else parser.status_code,
+                rt_ns=now - conn.start_ns,
+                content_length=0 if error else parser.body_length,
+                ts_ns=conn.start_ns,
+                thread_id=thread_id,
+                error=error,
+                ttfb_ns=(conn.first_byte_ns or now) - conn.start_ns
+            ))
+
+        def schedule(index: int):
+            nonlocal issued
+            conn = self.connections[index]
+            while issued < num_requests:
+                issued += 1
+                conn.start_ns = time.perf_counter_ns()
+                conn.first_byte_ns = 0
+                conn.error = ""
+                conn.parser.reset()
+
+                if conn.sock is None and not self._connect(index):
+                    record(index, time.perf_counter_ns(), conn.error)
+                    continue
+
+                self._queue(index, self.SEND)
+                self._queue(index, self.RECV)
+                in_flight.add(index)
+                return
+
+        for index in range(len(self.connections)):
+            schedule(index)
+
+        while len(results) < num_requests:
+            try:
+                self._submit_and_wait(wait_timeout)
+            except OSError as e:
+                if e.errno != errno.ETIME:
+                    raise
+                now = time.perf_counter_ns()
+                for index in list(in_flight):
+                    record(index, now, "Request timed out")
+                # Requests never sent still count, so the report covers every request asked for
+                for _ in range(num_requests - issued):
+                    results.append(TestResult(status_code=0, rt_ns=0, content_length=0, ts_ns=now,
+                                              thread_id=thread_id, error="Request not sent: run timed out"))
+                issued = num_requests
+                break
+
+            # CqeIter walks the CQ ring (wrapping correctly), exposing each entry as cqe[0]
+            completions = []
+            for _ in liburing.CqeIter(self.ring, self.cqe):
+                entry = self.cqe[0]
+                completions.append((entry.user_data, self._result(entry)))
+            liburing.io_uring_cq_advance(self.ring, len(completions))
+
+            for user_data, res in completions:
+                index, op = user_data >> 1, user_data & 1
+                conn = self.connections[index]
+                now = time.perf_counter_ns()
+
+                if op == self.SEND:
+                    # The linked RECV is cancelled on failure and reports the request
+                    if res < 0:
+                        conn.error = os.strerror(-res)
+                    continue
+
+                if conn.error or res < 0:
+                    record(index, now, conn.error or os.strerror(-res))
+                    self._disconnect(index)
+                else:
+                    # A malformed response fails this request only, like it does on the other paths
+                    try:
+                        if res == 0:
+                            complete = conn.parser.feed_eof()
+                            if not complete:
+                                conn.error = "Connection closed by server"
+                        else:
+                            if not conn.first_byte_ns:
+                                conn.first_byte_ns = now
+                            complete = conn.parser.feed(memoryview(conn.recv_buffer)[:res])
+                    except Exception as e:
+                        conn.error = str(e) or type(e).__name__
+
+                    if conn.error:
+                        record(index, now, conn.error)
+                        self._disconnect(index)
+                    elif not complete:
+                        self._queue(index, self.RECV)
+                        continue
+                    else:
+                        record(index, now)
+                        if res == 0 or not conn.parser.keep_alive:
+                            self._disconnect(index)
+
+                schedule(index)
+
+        progress.finish()
+        return results
+
+    def _submit_and_wait(self, wait_timeout):
+        if self.sqpoll:
+            # No syscall unless the SQ thread has gone idle and needs a wakeup
+            liburing.io_uring_submit(self.ring)
+            deadline = time.perf_counter() + self.SPIN_TIME
+            while time.perf_counter() < deadline:
+                if liburing.io_uring_cq_ready(self.ring):
+                    return
+
+        # One io_uring_enter submits every queued SQE and reaps completions
+        liburing.io_uring_submit_and_wait_timeout(self.ring, self.cqe, 1, wait_timeout)
+
+    def _connect(self, index: int) -> bool:
+        conn = self.connections[index]
+        try:
+            conn.sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+            conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError as e:
+            conn.error = str(e)
+            conn.sock = None
+            return False
+        liburing.io_uring_register_files_update(self.ring, liburing.FileIndex([conn.sock.fileno()]), index)
+        return True
+
+    def _disconnect(self, index: int):
+        conn = self.connections[index]
+        if conn.sock is not None:
+            liburing.io_uring_register_files_update(self.ring, liburing.FileIndex([-1]), index)
+            conn.sock.close()
+            conn.sock = None
+
+    def _queue(self, index: int, op: int):
+        sqe = liburing.io_uring_get_sqe(self.ring)
+        if op == self.SEND:
+            if self.fixed_buffers is not None:
+                liburing.io_uring_prep_write_fixed(sqe, index, self.request_bytes, 0)
+            else:
+                liburing.io_uring_prep_send(sqe, index, self.request_bytes)
+            sqe.flags |= liburing.IOSQE_FIXED_FILE | liburing.IOSQE_IO_LINK
+        else:
+            recv_buffer = self.connections[index].recv_buffer
+            if self.fixed_buffers is not None:
+                liburing.io_uring_prep_read_fixed(sqe, index, recv_buffer, index + 1)
+            else:
+                liburing.io_uring_prep_recv(sqe, index, recv_buffer)
+            sqe.flags |= liburing.IOSQE_FIXED_FILE
+        liburing.io_uring_sqe_set_data64(sqe, index << 1 | op)
+
+    @staticmethod
+    def _result(entry) -> int:
+        # The bindings raise for negative results; turn them back into -errno
+        try:
+            return entry.res
+        except OSError as e:
+            return -e.errno
+
+
 class StressTester:
-    def __init__(self, base_url: str = "https://google.com"):
+    def __init__(self, base_url: str = "https://google.com", use_io_uring: bool = False,
+                 sqpoll: bool = False, http_fast: bool = False, procs: int = 1):
         self.base_url = base_url.rstrip('/')
+        self.use_io_uring = use_io_uring or sqpoll
+        self.sqpoll = sqpoll
+        self.http_fast = http_fast
+        self.procs = procs
         self.session = None
+        self._prepared: Optional[requests.PreparedRequest] = None
+        self._send_settings: Dict[str, Any] = {}
+        self.timeout = 30
+        # The target never changes, so build the URL and headers once instead of per request
+        self._url = self.base_url + "/"
+        self._headers = dict(DEFAULT_HEADERS)
+        self._executor: Optional[ThreadPoolExecutor] = None
         self.analyzer = PerformanceAnalyzer()
 
+        # Pre-serialized HTTP/1.1 request for the raw socket paths (--http-fast and io_uring).
+        # Accept-Encoding is left out so the body length is the uncompressed size.
+        # Left as None when the URL has no host or a bad port; those requests then fail individually.
+        parts = urlsplit(self.base_url)
+        self._scheme = parts.scheme
+        self._host = self._port = self._host_header = self._req = None
+        try:
+            port = parts.port
+        except ValueError:
+            port = None
+        else:
+            if parts.hostname:
+                self._host = parts.hostname
+                self._port = port or (443 if parts.scheme == "https" else 80)
+                # Host comes from hostname/port rather than netloc so any user:pass@ userinfo stays out of it
+                host = f"[{parts.hostname}]" if ':' in parts.hostname else parts.hostname
+                self._host_header = f"{host}:{port}" if port else host
+                self._req = self._build_request(self._request_target(self._url), self._host_header)
+        self._ssl_context = ssl.create_default_context() if parts.scheme == "https" else None
+        self._fast_local = threading.local()
+        self._make_request = self.make_request_fast if http_fast else self.make_request
+
     def setup_session(self, timeout: int = 30):
-        """Setup requests session with appropriate settings"""
+        """Setup requests session with appropriate settings, reusing its keep-alive pool across tests"""
+        self.timeout = timeout
+        if self.session is not None:
+            return
+
         self.session = requests.Session()
         self.session.timeout = timeout
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        })
-
-    def make_request(self, endpoint: str = "/") -> TestResult:
-        """Make a single HTTP request and return results"""
-        url = f"{self.base_url}{endpoint}"
-        start_time = time.time()
-        thread_id = threading.current_thread().ident
+        self.session.headers.update(self._headers)
+
+        adapter = requests.adapters.HTTPAdapter(pool_connections=256, pool_maxsize=256, pool_block=False)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Prepared once and shared by every worker thread, so the URL is not re-parsed per request.
+        # An unparsable URL is left unprepared so make_request reports it per request.
+        try:
+            self._prepared = self.session.prepare_request(requests.Request('GET', self._url))
+        except requests.RequestException:
+            self._prepared = None
+        # Session.send skips the environment lookup session.get does, so resolve the proxy
+        # (HTTP(S)_PROXY, NO_PROXY) and CA bundle (REQUESTS_CA_BUNDLE) settings once here
+        self._send_settings = self.session.merge_environment_settings(self._url, {}, True, None, None)
+
+    @staticmethod
+    def _header_length(value: Optional[str], counted: int) -> int:
+        """Content-Length header as an int, or the counted body size when it is absent or malformed"""
+        try:
+            return int(value) if value is not None else counted
+        except ValueError:
+            return counted
+
+    @staticmethod
+    def _request_target(url: str) -> str:
+        """Path and query of url, as requests puts them on the request line"""
+        parts = urlsplit(url)
+        return f"{parts.path or '/'}?{parts.query}" if parts.query else parts.path or "/"
+
+    def _build_request(self, path: str, host: str) -> bytes:
+        return (f"GET {path} HTTP/1.1\r\nHost: {host}\r\n"
+                f"User-Agent: {self._headers['User-Agent']}\r\n"
+                f"Accept: {self._headers['Accept']}\r\n"
+                f"Connection: keep-alive\r\n\r\n").encode()
+
+    def _open_fast_socket(self) -> socket.socket:
+        sock = socket.create_connection((self._host, self._port), timeout=self.timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if self._ssl_context is not None:
+            sock = self._ssl_context.wrap_socket(sock, server_hostname=self._host)
+        return sock
+
+    def make_request_fast(self, endpoint: str = "/", scheduled_ns: int = 0) -> TestResult:
+        """Make a single HTTP/1.1 GET over this thread's raw keep-alive socket, bypassing requests"""
+        local = self._fast_local
+        if not hasattr(local, 'parser'):
+            local.sock = None
+            local.parser = HTTPResponseParser()
+            local.view = memoryview(bytearray(64 * 1024))
+
+        # Open-loop callers pass the intended send time so queueing delay counts towards latency
+        start_ns = scheduled_ns or time.perf_counter_ns()
+        thread_id = threading.get_ident()
+        if self._req is None:
+            return TestResult(
+                status_code=0,
+                rt_ns=time.perf_counter_ns() - start_ns,
+                content_length=0,
+                error=f"Invalid URL for raw socket requests: {self.base_url}",
+                ts_ns=start_ns,
+                thread_id=thread_id
+            )
+
+        if endpoint == "/":
+            request = self._req
+        else:
+            request = self._build_request(self._request_target(f"{self.base_url}{endpoint}"), self._host_header)
+        parser = local.parser
+        view = local.view
+        ttfb_ns = 0
+
+        # A reused socket may have been closed by the server while idle, so retry once on a fresh one
+        for attempt in range(2):
+            reused = local.sock is not None
+            try:
+                if not reused:
+                    local.sock = self._open_fast_socket()
+                sock = local.sock
+                parser.reset()
+                sock.sendall(request)
+
+                while True:
+                    received = sock.recv_into(view)
+                    if not received:
+                        if parser.feed_eof():
+                            break
+                        raise ConnectionError("Connection closed by server")
+                    # Only set once bytes arrive, so a clean close on a stale socket still gets retried
+                    if not ttfb_ns:
+                        ttfb_ns = time.perf_counter_ns() - start_ns
+                    if parser.feed(view[:received]):
+                        break
+
+                rt_ns = time.perf_counter_ns() - start_ns
+                if not parser.keep_alive:
+                    sock.close()
+                    local.sock = None
+
+                return TestResult(
+                    status_code=parser.status_code,
+                    rt_ns=rt_ns,
+                    content_length=parser.body_length,
+                    ts_ns=start_ns,
+                    thread_id=thread_id,
+                    ttfb_ns=ttfb_ns
+                )
+            except Exception as e:
+                if local.sock is not None:
+                    local.sock.close()
+                    local.sock = None
+                if reused and not ttfb_ns and attempt == 0:
+                    continue
+
+                return TestResult(
+                    status_code=0,
+                    rt_ns=time.perf_counter_ns() - start_ns,
+                    content_length=0,
+                    error=str(e) or type(e).__name__,
+                    ts_ns=start_ns,
+                    thread_id=thread_id
+                )
+
+    def make_request(self, endpoint: str = "/", scheduled_ns: int = 0) -> TestResult:
+        """Make a single HTTP request and return results; timing starts at scheduled_ns when given"""
+        start_ns = scheduled_ns or time.perf_counter_ns()
+        thread_id = threading.get_ident()
 
         try:
-            response = self.session.get(url)
-            response_time = time.time() - start_time
+            if endpoint == "/" and self._prepared is not None:
+                request = self._prepared
+            else:
+                request = self.session.prepare_request(requests.Request('GET', f"{self.base_url}{endpoint}"))
+            # stream=True returns once the headers arrive; the raw body is then drained
+            # undecoded in 64 KiB chunks so it is never held in memory as a whole
+            with self.session.send(request, timeout=self.timeout, **self._send_settings) as response:
+                ttfb_ns = time.perf_counter_ns() - start_ns
+                copied = 0
+                for chunk in response.raw.stream(65536, decode_content=False):
+                    copied += len(chunk)
+                rt_ns = time.perf_counter_ns() - start_ns
+                content_length = self._header_length(response.headers.get('Content-Length'), copied)
 
             return TestResult(
                 status_code=response.status_code,
-                response_time=response_time,
-                content_length=len(response.content),
-                timestamp=start_time,
+                rt_ns=rt_ns,
+                content_length=content_length,
+                ts_ns=start_ns,
                 thread_id=thread_id,
-                ttfb=response_time  # Simplified TTFB
+                ttfb_ns=ttfb_ns
             )
         except Exception as e:
-            response_time = time.time() - start_time
+            rt_ns = time.perf_counter_ns() - start_ns
             return TestResult(
                 status_code=0,
-                response_time=response_time,
+                rt_ns=rt_ns,
                 content_length=0,
                 error=str(e),
-                timestamp=start_time,
+                ts_ns=start_ns,
+                thread_id=thread_id
+            )
+
+    async def _make_request_async(self, session: aiohttp.ClientSession, endpoint: str = "/") -> TestResult:
+        """Make a single HTTP request on the shared aiohttp session and return results"""
+        url = f"{self.base_url}{endpoint}"
+        start_ns = time.perf_counter_ns()
+        thread_id = threading.get_ident()
+
+        try:
+            async with session.get(url) as response:
+                ttfb_ns = time.perf_counter_ns() - start_ns
+                copied = 0
+                async for chunk in response.content.iter_chunked(65536):
+                    copied += len(chunk)
+                rt_ns = time.perf_counter_ns() - start_ns
+
+                return TestResult(
+                    status_code=response.status,
+                    rt_ns=rt_ns,
+                    content_length=self._header_length(response.headers.get('Content-Length'), copied),
+                    ts_ns=start_ns,
+                    thread_id=thread_id,
+                    ttfb_ns=ttfb_ns
+                )
+        except Exception as e:
+            rt_ns = time.perf_counter_ns() - start_ns
+            return TestResult(
+                status_code=0,
+                rt_ns=rt_ns,
+                content_length=0,
+                error=str(e) or type(e).__name__,
+                ts_ns=start_ns,
                 thread_id=thread_id
             )
 
+    async def _run_async(self, report: TestReport, num_requests: int, max_workers: int) -> List[TestResult]:
+        """Drive all requests from one event loop, at most max_workers in flight"""
+        semaphore = asyncio.Semaphore(max_workers)
+        connector = aiohttp.TCPConnector(limit=max_workers, ttl_dns_cache=300, keepalive_timeout=60)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        progress = ProgressPrinter(num_requests)
+        completed = 0
+
+        # auto_decompress=False drains compressed bodies as-is, matching the requests path
+        async with aiohttp.ClientSession(connector=connector, headers=self._headers,
+                                         timeout=timeout, auto_decompress=False) as session:
+            async def bounded_request() -> TestResult:
+                nonlocal completed
+                async with semaphore:
+                    result = await self._make_request_async(session)
+
+                progress.update(completed)
+                completed += 1
+                return result
+
+            report.start_ns = time.perf_counter_ns()
+            results = await asyncio.gather(*(bounded_request() for _ in range(num_requests)))
+            report.end_ns = time.perf_counter_ns()
+
+        progress.finish()
+
+        return results
+
+    def _run_uring(self, report: TestReport, num_requests: int, max_workers: int) -> List[TestResult]:
+        """Drive all requests through io_uring over max_workers keep-alive connections"""
+        transport = UringTransport(self._host, self._port, self._req, max_workers,
+                                   self.timeout, sqpoll=self.sqpoll)
+        try:
+            report.start_ns = time.perf_counter_ns()
+            results = transport.run(num_requests)
+            report.end_ns = time.perf_counter_ns()
+        finally:
+            transport.close()
+
+        return results
+
+    def _run_concurrent(self, report: TestReport, num_requests: int, max_workers: int) -> List[TestResult]:
+        if self.use_io_uring:
+            return self._run_uring(report, num_requests, max_workers)
+        return run_event_loop(self._run_async(report, num_requests, max_workers))
+
+    # Rows of the shared result block written by --procs workers
+    _SHARD_COLUMNS = ('ts_ns', 'rt_ns', 'status_code', 'content_length', 'ttfb_ns')
+
+    def _run_procs(self, report: TestReport, num_requests: int, max_workers: int,
+                   procs: int) -> List[TestResult]:
+        """Split the requests across forked worker processes, each with its own event loop and pool"""
+        bounds = np.linspace(0, num_requests, procs + 1).astype(np.int64).tolist()
+        shard_workers = max(1, -(-max_workers // procs))
+        cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else None
+        ctx = multiprocessing.get_context('fork')
+
+        # One int64 block: a row per result column, then one progress counter per worker.
+        # Forked children inherit the shared mapping, so they write into these views directly.
+        num_columns = len(self._SHARD_COLUMNS)
+        shm = shared_memory.SharedMemory(create=True, size=(num_columns * num_requests + procs) * 8)
+        try:
+            columns = np.ndarray((num_columns, num_requests), dtype=np.int64, buffer=shm.buf)
+            done = np.ndarray(procs, dtype=np.int64, buffer=shm.buf, offset=columns.nbytes)
+            done[:] = 0
+
+            progress = ProgressPrinter(num_requests)
+            errors: Dict[int, str] = {}
+            pending = {}
+
+            report.start_ns = time.perf_counter_ns()
+            for shard in range(procs):
+                lo, hi = bounds[shard], bounds[shard + 1]
+                cpu = cpus[shard % len(cpus)] if cpus else None
+                reader, writer = ctx.Pipe(duplex=False)
+                proc = ctx.Process(target=self._run_shard, daemon=True,
+                                   args=(columns[:, lo:hi], done[shard:shard + 1], shard_workers, cpu, lo, writer))
+                proc.start()
+                writer.close()
+                pending[reader] = (proc, lo, hi)
+
+            while pending:
+                for reader in wait_connections(list(pending), timeout=ProgressPrinter.INTERVAL):
+                    proc, lo, hi = pending.pop(reader)
+                    try:
+                        shard_errors = reader.recv()
+                    except EOFError:
+                        shard_errors = None
+                    reader.close()
+                    proc.join()
+
+                    if shard_errors is None:
+                        # The worker died before reporting; count its whole shard as failed
+                        columns[:, lo:hi] = 0
+                        columns[0, lo:hi] = report.start_ns
+                        shard_errors = dict.fromkeys(range(lo, hi), f"Worker process exited with code {proc.exitcode}")
+                    errors.update(shard_errors)
+                progress.update(int(done.sum()))
+            report.end_ns = time.perf_counter_ns()
+            progress.finish()
+
+            return [TestResult(status_code=status, rt_ns=rt_ns, content_length=length, ts_ns=ts_ns,
+                               error=errors.get(i, ""), ttfb_ns=ttfb_ns)
+                    for i, (ts_ns, rt_ns, status, length, ttfb_ns) in enumerate(zip(*columns.tolist()))]
+        finally:
+            del columns, done
+            shm.close()
+            shm.unlink()
+
+    def _run_shard(self, columns: np.ndarray, done: np.ndarray, max_workers: int, cpu: Optional[int],
+                   offset: int, conn):
+        """Body of a --procs worker: run one shard and write its results into the shared columns"""
+        if cpu is not None:
+            os.sched_setaffinity(0, {cpu})
+        ProgressPrinter.sink = done
+
+        results = self._run_concurrent(TestReport(), columns.shape[1], max_workers)
+        columns[:] = np.array([(r.ts_ns, r.rt_ns, r.status_code, r.content_length, r.ttfb_ns)
+                               for r in results], dtype=np.int64).T
+        conn.send({offset + i: r.error for i, r in enumerate(results) if r.error})
+        conn.close()
+
     def sequential_test(self, num_requests: int = 100, delay: float = 0.1) -> TestReport:
         """Run sequential requests test"""
         print(f"🔄 Running sequential test with {num_requests} requests...")
 
         self.setup_session()
         report = TestReport()
-        report.start_time = time.time()
+        report.start_ns = time.perf_counter_ns()
+        progress = ProgressPrinter(num_requests)
 
         for i in range(num_requests):
-            if i % 10 == 0:
-                print(f"   Progress: {i}/{num_requests} requests completed")
+            progress.update(i)
 
-            result = self.make_request()
+            result = self._make_request()
             self._update_report(report, result)
 
             if delay > 0:
                 time.sleep(delay)
 
-        report.end_time = time.time()
+        report.end_ns = time.perf_counter_ns()
+        progress.finish()
         self._finalize_report(report)
         return report
 
     def concurrent_test(self, num_requests: int = 100, max_workers: int = 10) -> TestReport:
-        """Run concurrent requests test using ThreadPoolExecutor"""
+        """Run concurrent requests test on a single asyncio event loop"""
         print(f"🚀 Running concurrent test with {num_requests} requests and {max_workers} workers...")
 
-        self.setup_session()
         report = TestReport()
-        report.start_time = time.time()
+        if self.use_io_uring and not UringTransport.supported(self.base_url):
+            print("   ⚠️  io_uring unavailable (needs Linux >= 5.6, liburing and an http:// URL), using aiohttp")
+            self.use_io_uring = False
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = [executor.submit(self.make_request) for _ in range(num_requests)]
+        procs = min(self.procs, num_requests)
+        if procs > 1 and 'fork' not in multiprocessing.get_all_start_methods():
+            print("   ⚠️  --procs needs the fork start method, running in a single process")
+            procs = 1
 
-            for i, future in enumerate(as_completed(futures)):
-                if i % 10 == 0:
-                    print(f"   Progress: {i}/{num_requests} requests completed")
+        if procs > 1:
+            results = self._run_procs(report, num_requests, max_workers, procs)
+        else:
+            results = self._run_concurrent(report, num_requests, max_workers)
 
-                result = future.result()
-                self._update_report(report, result)
+        for result in results:
+            self._update_report(report, result)
 
-        report.end_time = time.time()
         self._finalize_report(report)
         return report
 
+    # Ramp-up threads per request/second of peak rate, i.e. the latency in seconds the schedule absorbs
+    # before submissions queue in the executor; queued time is still measured as latency
+    RAMP_POOL_FACTOR = 4
+
     def ramp_up_test(self, max_users: int = 50, ramp_duration: int = 30,
                      test_duration: int = 60) -> TestReport:
-        """Gradually ramp up the number of concurrent users"""
-        print(f"📈 Running ramp-up test: 0 to {max_users} users over {ramp_duration}s, then {test_duration}s at peak")
+        """Gradually ramp the request rate up to max_users requests/second, then hold it"""
+        print(f"📈 Running ramp-up test: 0 to {max_users} requests/second over {ramp_duration}s, "
+              f"then {test_duration}s at peak")
 
         self.setup_session()
         report = TestReport()
-        report.start_time = time.time()
-
-        # Phase 1: Ramp up
-        ramp_step = max_users / ramp_duration
-        for second in range(ramp_duration):
-            current_users = max(1, int(ramp_step * (second + 1)))  # Fix: ensure at least 1 user
-            print(f"   Ramp-up: {current_users} concurrent users")
-
-            with ThreadPoolExecutor(max_workers=current_users) as executor:
-                futures = [executor.submit(self.make_request) for _ in range(current_users)]
-
-                for future in as_completed(futures):
-                    result = future.result()
-                    self._update_report(report, result)
-
-            time.sleep(1)
-
-        # Phase 2: Sustained load
-        print(f"   Sustained load: {max_users} users for {test_duration} seconds")
-        for second in range(test_duration):
-            with ThreadPoolExecutor(max_workers=max_users) as executor:
-                futures = [executor.submit(self.make_request) for _ in range(max_users)]
-
-                for future in as_completed(futures):
-                    result = future.result()
-                    self._update_report(report, result)
+        report.start_ns = time.perf_counter_ns()
 
-            if second % 10 == 0:
-                print(f"   Sustained phase: {second}/{test_duration} seconds")
-            time.sleep(1)
+        # Threads are spawned lazily, so the headroom only costs anything once latency grows
+        self._executor = ThreadPoolExecutor(max_workers=max_users * self.RAMP_POOL_FACTOR)
+        outstanding = deque()
+        next_tick = time.perf_counter_ns()
 
-        report.end_time = time.time()
+        try:
+            # Phase 1: Ramp up
+            ramp_step = max_users / ramp_duration
+            for second in range(ramp_duration):
+                target_rps = max(1, int(ramp_step * (second + 1)))  # Fix: ensure at least 1 user
+                print(f"   Ramp-up: {target_rps} requests/second")
+
+                next_tick = self._submit_tick(report, outstanding, target_rps, next_tick)
+
+            # Phase 2: Sustained load
+            print(f"   Sustained load: {max_users} requests/second for {test_duration} seconds")
+            for second in range(test_duration):
+                if second % 10 == 0:
+                    print(f"   Sustained phase: {second}/{test_duration} seconds")
+
+                next_tick = self._submit_tick(report, outstanding, max_users, next_tick)
+
+            # Collect requests still in flight when the schedule ended
+            for future in as_completed(outstanding):
+                self._update_report(report, future.result())
+            outstanding.clear()
+        finally:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        report.end_ns = time.perf_counter_ns()
         self._finalize_report(report)
         return report
 
+    def _submit_tick(self, report: TestReport, outstanding: deque, target_rps: int,
+                     next_tick: int) -> int:
+        """Submit one second's worth of requests without waiting for responses (open-loop)"""
+        # Spread submissions evenly over the tick so the rate doesn't depend on latency.
+        # Each request is timed from its slot in the schedule, not from when a thread picks it up.
+        interval = 1_000_000_000 // target_rps
+        for i in range(target_rps):
+            scheduled_ns = next_tick + i * interval
+            delay = scheduled_ns - time.perf_counter_ns()
+            if delay > 0:
+                time.sleep(delay / 1e9)
+            outstanding.append(self._executor.submit(self._make_request, "/", scheduled_ns))
+
+        # Drain whatever has finished so far without blocking the schedule
+        done, _ = wait(outstanding, timeout=0)
+        if done:
+            for future in done:
+                self._update_report(report, future.result())
+            pending = [future for future in outstanding if future not in done]
+            outstanding.clear()
+            outstanding.extend(pending)
+
+        next_tick += 1_000_000_000
+        time.sleep(max(0, next_tick - time.perf_counter_ns()) / 1e9)
+        return next_tick
+
     def _update_report(self, report: TestReport, result: TestResult):
         """Update report with individual test result"""
         report.total_requests += 1
-        report.response_times.append(result.response_time)
-        report.results.append(result)
+
+        n = report._n
+        if n == report._cap:
+            report._cap *= 2
+            report._rt = np.resize(report._rt, report._cap)
+        report._rt[n] = result.rt_ns
+        report._n = n + 1
+
+        bucket = report.second_buckets[(result.ts_ns - report.start_ns) // 1_000_000_000]
+        bucket[0] += result.rt_ns
+        bucket[1] += 1
+        bucket[2] += result.status_code == 200
+
+        entry = (result.rt_ns, n, result)
+        if len(report.slowest_sample) < report.SLOWEST_SAMPLE_SIZE:
+            heapq.heappush(report.slowest_sample, entry)
+        elif entry > report.slowest_sample[0]:
+            heapq.heapreplace(report.slowest_sample, entry)
 
         if result.status_code == 0:
             report.failed_requests += 1
@@ -418,138 +1303,138 @@ class StressTester:
         else:
             report.successful_requests += 1
 
-        if result.status_code in report.status_codes:
-            report.status_codes[result.status_code] += 1
-        else:
-            report.status_codes[result.status_code] = 1
+        report.status_codes[result.status_code] += 1
 
     def _finalize_report(self, report: TestReport):
         """Calculate final statistics for the report"""
-        total_time = report.end_time - report.start_time
+        total_time = (report.end_ns - report.start_ns) / 1e9
         report.requests_per_second = report.total_requests / total_time if total_time > 0 else 0
 
-        # Find slowest requests
-        sorted_results = sorted(report.results, key=lambda x: x.response_time, reverse=True)
-        report.slowest_requests = sorted_results[:5]
+        # Timing stays in integer nanoseconds until here; the statistics are reported in seconds
+        report.rt_array = report.rt_ns_array / 1e9
+        report.rt_summary = summarize(report.rt_array) if report.rt_array.size else {}
+
+        # Find slowest requests (entries order by response time, then insertion sequence)
+        report.slowest_requests = [result for _, _, result in heapq.nlargest(5, report.slowest_sample)]
 
     def print_enhanced_report(self, report: TestReport, test_name: str):
         """Print enhanced test report with insights"""
-        print(f"\n{'=' * 80}")
-        print(f"🎯 PERFORMANCE ANALYSIS - {test_name.upper()}")
-        print(f"{'=' * 80}")
+        # Build the whole report in memory and write it to stdout once
+        out = io.StringIO()
+        w = out.write
+
+        w(f"\n{'=' * 80}\n")
+        w(f"🎯 PERFORMANCE ANALYSIS - {test_name.upper()}\n")
+        w(f"{'=' * 80}\n")
 
-        total_time = report.end_time - report.start_time
+        total_time = (report.end_ns - report.start_ns) / 1e9
         success_rate = (report.successful_requests / report.total_requests) * 100
-        avg_response_time = statistics.mean(report.response_times) if report.response_times else 0
+        stats = report.rt_summary
+        avg_response_time = stats['mean'] if stats else 0
 
         # Performance Grade
         grade = self.analyzer.calculate_performance_grade(avg_response_time, success_rate, report.requests_per_second)
-        print(f"📊 PERFORMANCE GRADE: {grade}")
+        w(f"📊 PERFORMANCE GRADE: {grade}\n")
 
         # Basic Metrics
-        print(f"\n📈 BASIC METRICS:")
-        print(f"   Test Duration: {total_time:.2f} seconds")
-        print(f"   Total Requests: {report.total_requests:,}")
-        print(f"   Successful: {report.successful_requests:,} ({success_rate:.1f}%)")
-        print(f"   Failed: {report.failed_requests:,} ({100 - success_rate:.1f}%)")
-        print(f"   Throughput: {report.requests_per_second:.1f} requests/second")
+        w(f"\n📈 BASIC METRICS:\n")
+        w(f"   Test Duration: {total_time:.2f} seconds\n")
+        w(f"   Total Requests: {report.total_requests:,}\n")
+        w(f"   Successful: {report.successful_requests:,} ({success_rate:.1f}%)\n")
+        w(f"   Failed: {report.failed_requests:,} ({100 - success_rate:.1f}%)\n")
+        w(f"   Throughput: {report.requests_per_second:.1f} requests/second\n")
 
         # Response Time Analysis
-        if report.response_times:
-            print(f"\n⏱️  RESPONSE TIME ANALYSIS:")
-            sorted_times = sorted(report.response_times)
+        if stats:
+            w(f"\n⏱️  RESPONSE TIME ANALYSIS:\n")
 
-            print(f"   Average: {avg_response_time:.3f}s")
-            print(f"   Median: {statistics.median(report.response_times):.3f}s")
-            print(f"   Fastest: {min(report.response_times):.3f}s")
-            print(f"   Slowest: {max(report.response_times):.3f}s")
+            w(f"   Average: {avg_response_time:.3f}s\n")
+            w(f"   Median: {stats['median']:.3f}s\n")
+            w(f"   Fastest: {stats['min']:.3f}s\n")
+            w(f"   Slowest: {stats['max']:.3f}s\n")
 
-            if len(report.response_times) > 1:
-                std_dev = statistics.stdev(report.response_times)
-                print(f"   Std Deviation: {std_dev:.3f}s")
-                print(f"   Variability: {'HIGH' if std_dev > avg_response_time * 0.5 else 'LOW'}")
+            if report.rt_array.size > 1:
+                std_dev = stats['std']
+                w(f"   Std Deviation: {std_dev:.3f}s\n")
+                w(f"   Variability: {'HIGH' if std_dev > avg_response_time * 0.5 else 'LOW'}\n")
 
             # Percentiles
-            p90_idx = int(len(sorted_times) * 0.90)
-            p95_idx = int(len(sorted_times) * 0.95)
-            p99_idx = int(len(sorted_times) * 0.99)
-
-            print(f"   90th percentile: {sorted_times[p90_idx]:.3f}s")
-            print(f"   95th percentile: {sorted_times[p95_idx]:.3f}s")
-            print(f"   99th percentile: {sorted_times[p99_idx]:.3f}s")
+            w(f"   90th percentile: {stats['p90']:.3f}s\n")
+            w(f"   95th percentile: {stats['p95']:.3f}s\n")
+            w(f"   99th percentile: {stats['p99']:.3f}s\n")
 
         # Performance Interpretation
-        print(f"\n💡 PERFORMANCE INTERPRETATION:")
+        w(f"\n💡 PERFORMANCE INTERPRETATION:\n")
         if avg_response_time < 0.2:
-            print("   ✅ EXCELLENT: Very fast response times")
+            w("   ✅ EXCELLENT: Very fast response times\n")
         elif avg_response_time < 0.5:
-            print("   ✅ GOOD: Fast response times")
+            w("   ✅ GOOD: Fast response times\n")
         elif avg_response_time < 1.0:
-            print("   ⚠️  ACCEPTABLE: Moderate response times")
+            w("   ⚠️  ACCEPTABLE: Moderate response times\n")
         elif avg_response_time < 2.0:
-            print("   ⚠️  SLOW: Response times are concerning")
+            w("   ⚠️  SLOW: Response times are concerning\n")
         else:
-            print("   ❌ CRITICAL: Very slow response times")
+            w("   ❌ CRITICAL: Very slow response times\n")
 
         if success_rate >= 99:
-            print("   ✅ EXCELLENT: Very high reliability")
+            w("   ✅ EXCELLENT: Very high reliability\n")
         elif success_rate >= 95:
-            print("   ✅ GOOD: High reliability")
+            w("   ✅ GOOD: High reliability\n")
         elif success_rate >= 90:
-            print("   ⚠️  ACCEPTABLE: Moderate reliability")
+            w("   ⚠️  ACCEPTABLE: Moderate reliability\n")
         else:
-            print("   ❌ CRITICAL: Low reliability")
+            w("   ❌ CRITICAL: Low reliability\n")
 
         # Bottleneck Analysis
         bottlenecks = self.analyzer.identify_bottlenecks(report)
-        print(f"\n🔍 BOTTLENECK ANALYSIS:")
+        w(f"\n🔍 BOTTLENECK ANALYSIS:\n")
         for bottleneck in bottlenecks:
             if "NO_MAJOR_BOTTLENECKS" in bottleneck:
-                print(f"   ✅ {bottleneck}")
+                w(f"   ✅ {bottleneck}\n")
             else:
-                print(f"   ⚠️  {bottleneck}")
+                w(f"   ⚠️  {bottleneck}\n")
 
         # Capacity Recommendations
         recommendations = self.analyzer.capacity_recommendations(report, test_name)
         if 'current_capacity' in recommendations:
-            print(f"\n🎯 CAPACITY ASSESSMENT:")
+            w(f"\n🎯 CAPACITY ASSESSMENT:\n")
             for key, value in recommendations['current_capacity'].items():
-                print(f"   • {value}")
+                w(f"   • {value}\n")
 
         if recommendations.get('scaling_recommendations'):
-            print(f"\n📈 SCALING RECOMMENDATIONS:")
+            w(f"\n📈 SCALING RECOMMENDATIONS:\n")
             for rec in recommendations['scaling_recommendations']:
-                print(f"   • {rec}")
+                w(f"   • {rec}\n")
 
         if recommendations.get('optimization_suggestions'):
-            print(f"\n⚡ OPTIMIZATION SUGGESTIONS:")
+            w(f"\n⚡ OPTIMIZATION SUGGESTIONS:\n")
             for suggestion in recommendations['optimization_suggestions']:
-                print(f"   • {suggestion}")
+                w(f"   • {suggestion}\n")
 
         # Status Code Distribution
-        print(f"\n📊 STATUS CODE DISTRIBUTION:")
+        w(f"\n📊 STATUS CODE DISTRIBUTION:\n")
         for status_code, count in sorted(report.status_codes.items()):
-            status_meaning = {
-                200: "OK", 201: "Created", 404: "Not Found",
-                500: "Server Error", 502: "Bad Gateway", 503: "Service Unavailable"
-            }.get(status_code, "Unknown")
-            print(f"   {status_code} ({status_meaning}): {count:,} requests")
+            status_meaning = STATUS_MEANINGS.get(status_code, "Unknown")
+            w(f"   {status_code} ({status_meaning}): {count:,} requests\n")
 
         # Slowest Requests
         if report.slowest_requests:
-            print(f"\n🐌 SLOWEST REQUESTS:")
+            w(f"\n🐌 SLOWEST REQUESTS:\n")
             for i, req in enumerate(report.slowest_requests, 1):
-                print(f"   {i}. {req.response_time:.3f}s (Status: {req.status_code})")
+                w(f"   {i}. {req.response_time:.3f}s (Status: {req.status_code})\n")
 
         # Performance Trends
-        trends = self.analyzer.analyze_performance_trends(report.results)
+        trends = self.analyzer.analyze_performance_trends(report)
         if trends and trends.get('response_time_trend'):
-            print(f"\n📈 PERFORMANCE TRENDS:")
-            print(f"   Response Time Trend: {trends['response_time_trend'].upper()}")
-            print(f"   Success Rate Trend: {trends['success_rate_trend'].upper()}")
+            w(f"\n📈 PERFORMANCE TRENDS:\n")
+            w(f"   Response Time Trend: {trends['response_time_trend'].upper()}\n")
+            w(f"   Success Rate Trend: {trends['success_rate_trend'].upper()}\n")
 
             if trends.get('performance_degradation'):
-                print("   ⚠️  WARNING: Significant performance degradation detected!")
+                w("   ⚠️  WARNING: Significant performance degradation detected!\n")
+
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
 
 
 def main(url):
@@ -562,10 +1447,21 @@ def main(url):
                         help='Number of concurrent workers')
     parser.add_argument('--test', choices=['sequential', 'concurrent', 'ramp', 'all'],
                         default='all', help='Type of test to run')
+    parser.add_argument('--io-uring', action='store_true',
+                        help='Use batched io_uring sockets for the concurrent test (Linux, http:// only)')
+    parser.add_argument('--sqpoll', action='store_true',
+                        help='With io_uring, let a kernel thread poll submissions (implies --io-uring)')
+    parser.add_argument('--http-fast', action='store_true',
+                        help='Send pre-serialized HTTP/1.1 GETs over raw keep-alive sockets in the '
+                             'sequential and ramp-up tests instead of using requests')
+    parser.add_argument('--procs', type=int, default=1,
+                        help='Split the concurrent test across this many forked processes, '
+                             'each pinned to a CPU with its own event loop and connection pool')
 
     args = parser.parse_args()
 
-    tester = StressTester(args.url)
+    tester = StressTester(args.url, use_io_uring=args.io_uring, sqpoll=args.sqpoll, http_fast=args.http_fast,
+                          procs=args.procs)
 
     print(f"🎯 Starting Advanced Stress Test")
     print(f"Target: {args.url}")